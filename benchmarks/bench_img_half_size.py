@@ -0,0 +1,82 @@
+"""
+Benchmarks convert_img_half_size over JPEG, PNG, 16-bit TIFF and half-float EXR inputs,
+comparing the fast exact 2x2 box path with the LANCZOS path.
+
+Usage:
+    python benchmarks/bench_img_half_size.py [--width 6000] [--height 4000] [--repeat 3]
+"""
+import sys
+import os
+import argparse
+import shutil
+import tempfile
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'src'))
+
+import numpy as np
+from PIL import Image
+
+import converter
+
+def _write_inputs(temp_dir, width, height):
+    """Writes one synthetic test image per format and returns {label: path}."""
+    rng = np.random.default_rng(0)
+    # Smooth gradients plus noise so the encoders do realistic work.
+    gradient = np.linspace(0.0, 1.0, width, dtype=np.float32)[None, :, None]
+    pixels = np.clip(gradient + rng.normal(0.0, 0.05, (height, width, 3)).astype(np.float32), 0.0, 1.0)
+
+    inputs = {}
+    pixels_uint8 = (pixels * 255.0 + 0.5).astype(np.uint8)
+    inputs["JPEG 8-bit"] = os.path.join(temp_dir, "bench.jpg")
+    Image.fromarray(pixels_uint8).save(inputs["JPEG 8-bit"], quality=95)
+    inputs["PNG 8-bit"] = os.path.join(temp_dir, "bench.png")
+    Image.fromarray(pixels_uint8).save(inputs["PNG 8-bit"])
+
+    if converter.OIIO:
+        for label, filename, pixel_format in (("TIFF 16-bit", "bench.tif", converter.OIIO.UINT16),
+                                              ("EXR half", "bench.exr", converter.OIIO.HALF)):
+            path = os.path.join(temp_dir, filename)
+            image_output = converter.OIIO.ImageOutput.create(path)
+            image_output.open(path, converter.OIIO.ImageSpec(width, height, 3, pixel_format))
+            image_output.write_image(pixels)
+            image_output.close()
+            inputs[label] = path
+    else:
+        print("OpenImageIO not available, skipping TIFF/EXR inputs.")
+
+    return inputs
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark convert_img_half_size.")
+    parser.add_argument("--width", type=int, default=6000)
+    parser.add_argument("--height", type=int, default=4000)
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case; the fastest is reported.")
+    args = parser.parse_args()
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        inputs = _write_inputs(temp_dir, args.width, args.height)
+        results = []
+        for label, path in inputs.items():
+            timings = {}
+            for method in converter.HALF_SIZE_METHODS:
+                best = float('inf')
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    if not converter.convert_img_half_size(path, method=method):
+                        raise SystemExit(f"convert_img_half_size failed for {label} ({method})")
+                    best = min(best, time.perf_counter() - start)
+                timings[method] = best
+            results.append((label, timings))
+
+        print(f"\nconvert_img_half_size, {args.width}x{args.height} input, best of {args.repeat}")
+        print(f"{'Input':<14}{'box (s)':>10}{'lanczos (s)':>14}{'speed-up':>10}")
+        for label, timings in results:
+            print(f"{label:<14}{timings['box']:>10.3f}{timings['lanczos']:>14.3f}{timings['lanczos'] / timings['box']:>9.1f}x")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+if __name__ == '__main__':
+    main()
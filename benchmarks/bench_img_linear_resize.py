@@ -0,0 +1,98 @@
+"""
+Benchmarks linear-light resampling against the plain sRGB path of convert_img_resize
+and convert_img_half_size, and checks that it stays within the 1.5x speed budget.
+The plain JPEG half size decodes at half scale in the DCT domain, which the linear path
+cannot do (it would average encoded values); that row is reported but not budgeted.
+The linear path resamples bands on threads, so the ratio improves with the core count.
+
+Usage:
+    python benchmarks/bench_img_linear_resize.py [--width 6000] [--height 4000] [--repeat 3]
+"""
+import sys
+import os
+import argparse
+import shutil
+import tempfile
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'src'))
+
+import numpy as np
+from PIL import Image
+
+import converter
+
+MAX_SLOWDOWN = 1.5
+
+def _write_inputs(temp_dir, width, height):
+    """Writes one synthetic test image per format and returns {label: path}."""
+    rng = np.random.default_rng(0)
+    gradient = np.linspace(0.0, 1.0, width, dtype=np.float32)[None, :, None]
+    pixels = np.clip(gradient + rng.normal(0.0, 0.05, (height, width, 3)).astype(np.float32), 0.0, 1.0)
+
+    inputs = {}
+    pixels_uint8 = (pixels * 255.0 + 0.5).astype(np.uint8)
+    inputs["JPEG 8-bit"] = os.path.join(temp_dir, "bench.jpg")
+    Image.fromarray(pixels_uint8).save(inputs["JPEG 8-bit"], quality=95)
+    inputs["PNG 8-bit"] = os.path.join(temp_dir, "bench.png")
+    Image.fromarray(pixels_uint8).save(inputs["PNG 8-bit"])
+
+    if converter.OIIO:
+        path = os.path.join(temp_dir, "bench.tif")
+        image_output = converter.OIIO.ImageOutput.create(path)
+        image_output.open(path, converter.OIIO.ImageSpec(width, height, 3, converter.OIIO.UINT16))
+        image_output.write_image(pixels)
+        image_output.close()
+        inputs["TIFF 16-bit"] = path
+    else:
+        print("OpenImageIO not available, skipping the TIFF input.")
+
+    return inputs
+
+def _best_time(function, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        if not function():
+            raise SystemExit("Conversion failed, see the errors above.")
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark linear-light resampling.")
+    parser.add_argument("--width", type=int, default=6000)
+    parser.add_argument("--height", type=int, default=4000)
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case; the fastest is reported.")
+    args = parser.parse_args()
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        inputs = _write_inputs(temp_dir, args.width, args.height)
+        target_width = args.width // 3
+        rows = []
+        for label, path in inputs.items():
+            for operation, run in (
+                (f"resize {target_width}px", lambda linear: converter.convert_img_resize(path, target_width, linear_light=linear)),
+                ("half size", lambda linear: converter.convert_img_half_size(path, linear_light=linear)),
+            ):
+                plain = _best_time(lambda: run(False), args.repeat)
+                linear = _best_time(lambda: run(True), args.repeat)
+                budgeted = not (label.startswith("JPEG") and operation == "half size")
+                rows.append((label, operation, plain, linear, budgeted))
+
+        print(f"\nLinear-light vs plain resampling, {args.width}x{args.height} input, best of {args.repeat}, {os.cpu_count()} CPU(s)")
+        print(f"{'Input':<14}{'Operation':<16}{'plain (s)':>10}{'linear (s)':>12}{'ratio':>8}")
+        within_budget = True
+        for label, operation, plain, linear, budgeted in rows:
+            ratio = linear / plain
+            if budgeted:
+                within_budget = within_budget and ratio <= MAX_SLOWDOWN
+            note = "" if budgeted else "  (plain uses DCT draft, not budgeted)"
+            print(f"{label:<14}{operation:<16}{plain:>10.3f}{linear:>12.3f}{ratio:>7.2f}x{note}")
+        print(f"\nAll cases within {MAX_SLOWDOWN}x of the plain path: {'yes' if within_budget else 'NO'}")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmarks PNG frame extraction (convert_mp4_to_png_sequence): throughput and output
+size per zlib compression level and row prediction filter, and single-process versus
+segment-parallel extraction. The source is a synthetic H.264 clip (FFmpeg's testsrc2
+with temporal grain, so it is not trivially compressible).
+
+Usage:
+    python benchmarks/bench_png_extraction.py [--width 1920] [--height 1080] [--duration 10]
+"""
+import sys
+import os
+import argparse
+import glob
+import shutil
+import subprocess
+import tempfile
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'src'))
+
+import converter
+
+COMPRESSION_LEVELS = (1, 3, 6, 9)
+PREDICTION_MODES = ("none", "sub", "paeth", "mixed")
+
+def _write_clip(temp_dir, width, height, duration):
+    """Encodes the synthetic source clip and returns its path."""
+    path = os.path.join(temp_dir, "bench.mp4")
+    subprocess.run([converter.FFMPEG_EXE, '-y', '-hide_banner', '-loglevel', 'error',
+                    '-f', 'lavfi', '-i', f"testsrc2=size={width}x{height}:rate=25,noise=alls=12:allf=t",
+                    '-t', str(duration), '-c:v', 'libx264', '-preset', 'veryfast', '-g', '25', '-pix_fmt', 'yuv420p', path],
+                   check=True, capture_output=True)
+    return path
+
+def _run_case(clip_path, **kwargs):
+    """Extracts the clip once and returns (seconds, number of frames, total bytes)."""
+    output_dir = os.path.splitext(clip_path)[0]
+    shutil.rmtree(output_dir, ignore_errors=True)
+    start = time.perf_counter()
+    if not converter.convert_mp4_to_png_sequence(clip_path, **kwargs):
+        raise SystemExit("Extraction failed, see the errors above.")
+    elapsed = time.perf_counter() - start
+    files = glob.glob(os.path.join(output_dir, "*.png"))
+    return elapsed, len(files), sum(os.path.getsize(f) for f in files)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark PNG frame extraction settings.")
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=1080)
+    parser.add_argument("--duration", type=float, default=10, help="Clip duration in seconds.")
+    parser.add_argument("--segments", type=int, default=os.cpu_count() or 1,
+                        help="Segments of the parallel case. Defaults to the CPU count.")
+    args = parser.parse_args()
+
+    if not os.path.exists(converter.FFMPEG_EXE):
+        raise SystemExit(f"FFmpeg executable not found at '{converter.FFMPEG_EXE}'.")
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        clip_path = _write_clip(temp_dir, args.width, args.height, args.duration)
+        rows = []
+        for compression in COMPRESSION_LEVELS:
+            for prediction in PREDICTION_MODES:
+                rows.append((f"level {compression}, pred {prediction}", "1",
+                             *_run_case(clip_path, png_compression=compression, png_prediction=prediction)))
+        for segments in sorted({1, args.segments}):
+            rows.append(("FFmpeg default", str(segments), *_run_case(clip_path, segments=segments)))
+
+        print(f"\nPNG extraction, {args.width}x{args.height}, {args.duration:g}s clip, {os.cpu_count()} CPU(s)")
+        print(f"{'Settings':<26}{'Segments':>9}{'fps':>9}{'MB/frame':>10}{'Total MB':>10}")
+        for label, segments, elapsed, frames, size in rows:
+            print(f"{label:<26}{segments:>9}{frames / elapsed:>9.1f}{size / max(frames, 1) / 1e6:>10.2f}{size / 1e6:>10.1f}")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+import sys
+import os
+import argparse
+
+# This allows the script to find the 'converter' module.
+sys.path.append(os.path.dirname(__file__))
+
+import converter
+
+def main():
+    """
+    Entry point for tuning the encoder profiles to this machine.
+    Encodes a short synthetic clip at several x264 presets and saves the fastest preset
+    meeting each profile's size target.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark libx264 and tune the draft/review/master encoder profiles.")
+    parser.add_argument("--width", type=int, default=1920, help="Width of the synthetic clip. Default is 1920.")
+    parser.add_argument("--height", type=int, default=1080, help="Height of the synthetic clip. Default is 1080.")
+    parser.add_argument("--duration", type=float, default=4, help="Duration of the synthetic clip in seconds. Default is 4.")
+    parser.add_argument("--presets", help="Comma-separated candidate x264 presets, e.g. veryfast,fast,medium,slow.")
+    parser.add_argument("--reset", action="store_true", help="Remove the tuned profiles and go back to the defaults.")
+
+    args = parser.parse_args()
+
+    try:
+        if args.reset:
+            if os.path.exists(converter.ENCODER_PROFILES_PATH):
+                os.remove(converter.ENCODER_PROFILES_PATH)
+            print("Encoder profiles reset to the defaults.")
+            return
+
+        presets = [p for p in args.presets.replace(' ', '').split(',') if p] if args.presets else None
+        success = converter.autotune_encoder_profiles(width=args.width, height=args.height,
+                                                      duration=args.duration, presets=presets)
+
+        if success:
+            print("\nEncoder profiles tuned successfully!")
+        else:
+            print("\nEncoder tuning failed. Please check the errors above.")
+    except Exception as e:
+        print(f"\nAn unhandled error occurred: {e}")
+        import traceback
+        traceback.print_exc()
+    finally:
+        print("Press Enter to exit.")
+        input() # Waits for user input
+
+
+if __name__ == '__main__':
+    main()
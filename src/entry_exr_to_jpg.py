@@ -1,5 +1,6 @@
 import sys
 import os
+import argparse
 
 # This allows the script to find the 'converter' module.
 sys.path.append(os.path.dirname(__file__))
@@ -10,14 +11,18 @@ def main():
     """
     Entry point for the EXR (ACEScg) sequence to sRGB JPG sequence conversion.
     """
-    try:
-        if len(sys.argv) < 2:
-            print("Error: No file path provided.")
-            print("Press Enter to exit.")
-            input()
-            return
+    parser = argparse.ArgumentParser(description="Convert an EXR (ACEScg) sequence to an sRGB JPG sequence.")
+    parser.add_argument("file_path", help="Path to one file of the EXR sequence.")
+    parser.add_argument("--sanitize", choices=converter.SANITIZE_MODES, default="clamp",
+                        help="NaN/Inf handling: report only, clamp to 0/half-float max, or repair from neighbours. Default is clamp.")
+    parser.add_argument("--clamp-negatives", action="store_true", help="Clamp negative linear values to 0.")
+    parser.add_argument("--qc-threshold", type=float, default=0.0,
+                        help="Fraction of NaN/Inf pixels above which a frame is flagged in the QC report. Default is 0.")
+
+    args = parser.parse_args()
 
-        file_path = sys.argv[1]
+    try:
+        file_path = args.file_path
 
         if not os.path.exists(file_path):
             print(f"Error: The file '{file_path}' does not exist.")
@@ -27,7 +32,9 @@ def main():
 
         print(f"File provided for EXR sequence: {file_path}")
         
-        success = converter.convert_exr_to_srgb_jpg_sequence(file_path)
+        success = converter.convert_exr_to_srgb_jpg_sequence(file_path, sanitize=args.sanitize,
+                                                             clamp_negatives=args.clamp_negatives,
+                                                             qc_threshold=args.qc_threshold)
 
         if success:
             print("\nConversion finished successfully!")
@@ -43,4 +50,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -1,5 +1,6 @@
 import sys
 import os
+import argparse
 
 # This allows the script to find the 'converter' module.
 sys.path.append(os.path.dirname(__file__))
@@ -9,15 +10,28 @@ import converter
 def main():
     """
     Entry point for the EXR (ACEScg) sequence to sRGB MP4 conversion.
+    With --follow, the sequence is encoded while it is still being rendered.
     """
-    try:
-        if len(sys.argv) < 2:
-            print("Error: No file path provided.")
-            print("Press Enter to exit.")
-            input()
-            return
+    parser = argparse.ArgumentParser(description="Convert an EXR (ACEScg) sequence to an sRGB MP4.")
+    parser.add_argument("file_path", help="Path to one file of the EXR sequence.")
+    parser.add_argument("--framerate", type=int, default=25, help="Frame rate of the output video. Default is 25.")
+    parser.add_argument("--follow", action="store_true",
+                        help="Keep encoding new frames as they are rendered until the end frame or idle timeout.")
+    parser.add_argument("--end-frame", type=int, default=None, help="Last frame to wait for in follow mode.")
+    parser.add_argument("--idle-timeout", type=float, default=600,
+                        help="Seconds without a new frame before finalizing in follow mode. Default is 600.")
+    parser.add_argument("--sanitize", choices=converter.SANITIZE_MODES, default="clamp",
+                        help="NaN/Inf handling: report only, clamp to 0/half-float max, or repair from neighbours. Default is clamp.")
+    parser.add_argument("--clamp-negatives", action="store_true", help="Clamp negative linear values to 0.")
+    parser.add_argument("--qc-threshold", type=float, default=0.0,
+                        help="Fraction of NaN/Inf pixels above which a frame is flagged in the QC report. Default is 0.")
+    parser.add_argument("--profile", choices=list(converter.ENCODER_PROFILES), default=converter.DEFAULT_ENCODER_PROFILE,
+                        help="Encoder speed/quality profile. Default is review.")
+
+    args = parser.parse_args()
 
-        file_path = sys.argv[1]
+    try:
+        file_path = args.file_path
 
         if not os.path.exists(file_path):
             print(f"Error: The file '{file_path}' does not exist.")
@@ -27,7 +41,10 @@ def main():
 
         print(f"File provided for EXR sequence: {file_path}")
         
-        success = converter.convert_exr_to_srgb_mp4(file_path, framerate=25)
+        success = converter.convert_exr_to_srgb_mp4(file_path, framerate=args.framerate, follow=args.follow,
+                                                    end_frame=args.end_frame, idle_timeout=args.idle_timeout,
+                                                    sanitize=args.sanitize, clamp_negatives=args.clamp_negatives,
+                                                    qc_threshold=args.qc_threshold, profile=args.profile)
 
         if success:
             print("\nConversion finished successfully!")
@@ -43,4 +60,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
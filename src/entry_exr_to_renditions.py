@@ -0,0 +1,71 @@
+import sys
+import os
+import argparse
+
+# This allows the script to find the 'converter' module.
+sys.path.append(os.path.dirname(__file__))
+
+import converter
+
+def main():
+    """
+    Entry point for the EXR (ACEScg) sequence to sRGB MP4 + JPG sequence + proxy conversion.
+    Every frame is decoded and color-converted once and written to all outputs.
+    """
+    parser = argparse.ArgumentParser(description="Convert an EXR sequence to sRGB MP4, JPG sequence and proxy MP4 in one pass.")
+    parser.add_argument("file_path", help="Path to one file of the EXR sequence.")
+    parser.add_argument("--framerate", type=int, default=25, help="Frame rate of the MP4 outputs. Default is 25.")
+    parser.add_argument("--quality", type=int, default=90, help="JPEG quality (1-100). Default is 90.")
+    parser.add_argument("--proxy-scale", type=float, default=0.5,
+                        help="Scale of the proxy MP4. Use 0 to skip the proxy. Default is 0.5.")
+    parser.add_argument("--no-mp4", action="store_true", help="Do not write the full-resolution MP4.")
+    parser.add_argument("--no-jpg", action="store_true", help="Do not write the JPG sequence.")
+    parser.add_argument("--sanitize", choices=converter.SANITIZE_MODES, default="clamp",
+                        help="NaN/Inf handling: report only, clamp to 0/half-float max, or repair from neighbours. Default is clamp.")
+    parser.add_argument("--clamp-negatives", action="store_true", help="Clamp negative linear values to 0.")
+    parser.add_argument("--qc-threshold", type=float, default=0.0,
+                        help="Fraction of NaN/Inf pixels above which a frame is flagged in the QC report. Default is 0.")
+    parser.add_argument("--profile", choices=list(converter.ENCODER_PROFILES), default=converter.DEFAULT_ENCODER_PROFILE,
+                        help="Encoder speed/quality profile. Default is review.")
+
+    args = parser.parse_args()
+
+    try:
+        file_path = args.file_path
+
+        if not os.path.exists(file_path):
+            print(f"Error: The file '{file_path}' does not exist.")
+            print("Press Enter to exit.")
+            input()
+            return
+
+        print(f"File provided for EXR sequence: {file_path}")
+
+        success = converter.convert_exr_to_srgb_renditions(
+            file_path,
+            framerate=args.framerate,
+            write_mp4=not args.no_mp4,
+            write_jpg_sequence=not args.no_jpg,
+            proxy_scale=args.proxy_scale or None,
+            quality=args.quality,
+            sanitize=args.sanitize,
+            clamp_negatives=args.clamp_negatives,
+            qc_threshold=args.qc_threshold,
+            profile=args.profile,
+        )
+
+        if success:
+            print("\nConversion finished successfully!")
+        else:
+            print("\nConversion failed. Please check the errors above.")
+    except Exception as e:
+        print(f"\nAn unhandled error occurred: {e}")
+        import traceback
+        traceback.print_exc()
+    finally:
+        print("Press Enter to exit.")
+        input() # Waits for user input
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,6 @@
 import sys
 import os
+import argparse
 import win32com.client # Required for pywin32 shell interaction
 import hashlib
 import tempfile
@@ -41,10 +42,27 @@ def main():
     Entry point for creating an image contact sheet.
     Retrieves selected files directly from Windows Explorer using pywin32.
     """
+    parser = argparse.ArgumentParser(description="Create a contact sheet from the images selected in Explorer.")
+    parser.add_argument("--columns", type=int, default=2, help="Number of columns of the grid.")
+    parser.add_argument("--padding", type=int, default=10, help="Padding between images and around the border.")
+    parser.add_argument("--cell-height", type=int, default=converter.CONTACT_SHEET_CELL_HEIGHT,
+                        help="Maximum cell height in pixels; images are only scaled down.")
+    parser.add_argument("--workers", type=int, default=None, help="Number of thumbnail threads (default: CPU count).")
+    parser.add_argument("--no-cache", action="store_true", help="Do not read or write the thumbnail cache.")
+    parser.add_argument("--output", default="contact_sheet.jpg",
+                        help="Output file name. A .tif/.tiff/.exr name streams the sheet into a tiled file.")
+    parser.add_argument("--pyramid", action="store_true", help="Add MIP levels to a tiled TIFF/EXR output.")
+    sampling_group = parser.add_mutually_exclusive_group()
+    sampling_group.add_argument("--frames", type=int, default=None,
+                                help="With one frame of a sequence selected, show this many evenly spaced frames.")
+    sampling_group.add_argument("--every", type=int, default=None,
+                                help="With one frame of a sequence selected, show every Nth frame.")
+    args = parser.parse_args()
+
     image_paths = get_selected_files_from_explorer()
 
     # Define accepted image file extensions
-    ACCEPTED_IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp', '.exr') # Add more as needed
+    ACCEPTED_IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tif', '.tiff', '.webp', '.exr') # Add more as needed
 
     # Filter out non-existent files and non-image files
     temp_valid_image_paths = [p for p in image_paths if os.path.exists(p)]
@@ -96,7 +114,12 @@ def main():
             print(f"  - {os.path.basename(path)}")
 
         # The create_contact_sheet function will determine output path based on the first image's directory
-        success = converter.create_contact_sheet(valid_image_paths)
+        success = converter.create_contact_sheet(valid_image_paths, output_filename=args.output,
+                                                 columns=args.columns, padding=args.padding,
+                                                 cell_height=args.cell_height, max_workers=args.workers,
+                                                 cache_dir=None if args.no_cache else converter.THUMBNAIL_CACHE_DIR,
+                                                 pyramid=args.pyramid, sample_count=args.frames,
+                                                 sample_step=args.every)
 
         if success:
             print("\nContact sheet created successfully!")
@@ -1,37 +1,124 @@
 import sys
 import os
+import argparse
+import hashlib
+import tempfile
+import time # For time.sleep
 
 sys.path.append(os.path.dirname(__file__))
 
-import converter
+# converter (numpy, PIL, OIIO, OCIO) is imported only after the selection lock is acquired,
+# so the redundant per-file invocations Explorer starts for a multi-selection exit quickly.
+
+def get_selected_files_from_explorer():
+    """
+    Retrieves the full paths of files selected in the active Windows Explorer window.
+    Requires pywin32.
+    """
+    selected_files = []
+    try:
+        import win32com.client # Required for pywin32 shell interaction
+        shell_app = win32com.client.Dispatch("Shell.Application")
+        for window in shell_app.Windows():
+            if os.path.basename(window.FullName).lower() == "explorer.exe":
+                try:
+                    selection = window.document.SelectedItems()
+                    if selection.Count > 0:
+                        for item in selection:
+                            selected_files.append(item.Path)
+                        return selected_files
+                except Exception as e:
+                    pass
+    except Exception as e:
+        print(f"ERROR: Could not access Windows Shell Application: {e}")
+        print("Please ensure pywin32 is correctly installed and you are running this from Explorer.")
+    return selected_files
+
+def read_file_list(file_list_path):
+    """
+    Reads image paths from a text file, one path per line. Empty lines are ignored.
+    """
+    with open(file_list_path, encoding="utf-8") as f:
+        return [line.strip().strip('"') for line in f if line.strip()]
 
 def main():
     """
     Entry point for the image half size conversion.
+    Accepts image paths, a --file-list file, or (without either) the current Explorer selection.
+    Several images are processed on a process pool.
     """
-    if len(sys.argv) < 2:
-        print("Error: No file path provided.")
+    parser = argparse.ArgumentParser(description="Scale images down to half their size.")
+    parser.add_argument("image_paths", nargs="*", help="Paths to the input image files.")
+    parser.add_argument("--file-list", help="Text file with one image path per line.")
+    parser.add_argument("--method", choices=("box", "lanczos"), default="box",
+                        help="'box' uses the fast exact 2x2 path (default), 'lanczos' the LANCZOS filter.")
+    parser.add_argument("--linear", action="store_true", help="Resample in linear light instead of on the encoded sRGB values.")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes. Defaults to the CPU count.")
+
+    args = parser.parse_args()
+
+    image_paths = list(args.image_paths)
+    if args.file_list:
+        image_paths.extend(read_file_list(args.file_list))
+    from_explorer = not image_paths
+    if from_explorer:
+        image_paths = get_selected_files_from_explorer()
+
+    valid_image_paths = [p for p in image_paths if os.path.exists(p)]
+    if not valid_image_paths:
+        print("Error: No valid image files found (or none selected in Explorer).")
         print("Press Enter to exit.")
         input()
         return
 
-    image_path = sys.argv[1]
+    # --- Implement Lock File Mechanism ---
+    # Create a unique identifier for this set of selected files
+    # Sort for consistent hash regardless of selection order
+    lock_acquired = False
+    lock_file_path = None
+    if from_explorer:
+        selected_files_hash = hashlib.md5("".join(sorted(valid_image_paths)).encode()).hexdigest()
+        lock_dir = os.path.join(tempfile.gettempdir(), "TS_Toolbox_ImgHalfSize_Locks")
+        os.makedirs(lock_dir, exist_ok=True)
+        lock_file_path = os.path.join(lock_dir, f"{selected_files_hash}.lock")
+        try:
+            fd = os.open(lock_file_path, os.O_CREAT | os.O_EXCL | os.O_RDWR)
+            os.close(fd)
+            lock_acquired = True
+            time.sleep(0.5) # Give a small buffer time
+        except FileExistsError:
+            print("Another instance of Half Size is already processing this selection. Exiting redundant invocation.")
+            return
+        except Exception as e:
+            print(f"ERROR: Could not create lock file {lock_file_path}: {e}. Proceeding anyway, but may cause redundant operations.")
 
-    if not os.path.exists(image_path):
-        print(f"Error: The file '{image_path}' does not exist.")
+    try:
+        import converter
+
+        if len(valid_image_paths) == 1:
+            print(f"Image to half size: {valid_image_paths[0]}")
+            success = converter.convert_img_half_size(valid_image_paths[0], method=args.method, linear_light=args.linear)
+        else:
+            print(f"Scaling {len(valid_image_paths)} images to half size...")
+            success = converter.convert_img_half_size_batch(valid_image_paths, method=args.method, max_workers=args.workers,
+                                                          linear_light=args.linear)
+
+        if success:
+            print("\nConversion finished successfully!")
+        else:
+            print("\nConversion failed. Please check the errors above.")
+    except Exception as e:
+        print(f"\nAn unhandled error occurred: {e}")
+        import traceback
+        traceback.print_exc()
+    finally:
+        if lock_acquired and os.path.exists(lock_file_path):
+            try:
+                os.remove(lock_file_path)
+            except Exception as e:
+                print(f"WARNING: Could not remove lock file {lock_file_path}: {e}")
         print("Press Enter to exit.")
         input()
-        return
-        
-    print(f"Image to half size: {image_path}")
-    success = converter.convert_img_half_size(image_path)
-
-    if success:
-        print("\nConversion finished successfully!")
-    else:
-        print("\nConversion failed. Please check the errors above.")
-    print("Press Enter to exit.")
-    input()
 
 
 if __name__ == '__main__':
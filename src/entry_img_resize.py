@@ -1,46 +1,142 @@
 import sys
 import os
 import argparse
+import hashlib
+import tempfile
+import time # For time.sleep
 
 sys.path.append(os.path.dirname(__file__))
 
-import converter
+# converter (numpy, PIL, OIIO, OCIO) is imported only after the selection lock is acquired,
+# so the redundant per-file invocations Explorer starts for a multi-selection exit quickly.
+
+def get_selected_files_from_explorer():
+    """
+    Retrieves the full paths of files selected in the active Windows Explorer window.
+    Requires pywin32.
+    """
+    selected_files = []
+    try:
+        import win32com.client # Required for pywin32 shell interaction
+        shell_app = win32com.client.Dispatch("Shell.Application")
+        for window in shell_app.Windows():
+            if os.path.basename(window.FullName).lower() == "explorer.exe":
+                try:
+                    selection = window.document.SelectedItems()
+                    if selection.Count > 0:
+                        for item in selection:
+                            selected_files.append(item.Path)
+                        return selected_files
+                except Exception as e:
+                    pass
+    except Exception as e:
+        print(f"ERROR: Could not access Windows Shell Application: {e}")
+        print("Please ensure pywin32 is correctly installed and you are running this from Explorer.")
+    return selected_files
+
+def read_file_list(file_list_path):
+    """
+    Reads image paths from a text file, one path per line. Empty lines are ignored.
+    """
+    with open(file_list_path, encoding="utf-8") as f:
+        return [line.strip().strip('"') for line in f if line.strip()]
+
+def parse_widths(widths_str):
+    """
+    Parses a comma-separated list of widths (e.g. "3840,1920,960").
+    Returns a list of positive integers, or None if the input is invalid.
+    """
+    try:
+        widths = [int(w) for w in widths_str.replace(' ', '').split(',') if w]
+    except ValueError:
+        return None
+    if not widths or any(w <= 0 for w in widths):
+        return None
+    return widths
 
 def main():
     """
     Entry point for the image resize conversion.
+    Accepts image paths, a --file-list file, or (without either) the current Explorer selection.
+    Several images are processed on a process pool; several comma-separated widths produce
+    all sizes from a single decode.
     """
-    parser = argparse.ArgumentParser(description="Resize an image to a specified width.")
-    parser.add_argument("image_path", help="Path to the input image file.")
+    parser = argparse.ArgumentParser(description="Resize images to a specified width.")
+    parser.add_argument("image_paths", nargs="*", help="Paths to the input image files.")
+    parser.add_argument("--file-list", help="Text file with one image path per line.")
     parser.add_argument("--width", type=int, help="Desired new width for the image.")
+    parser.add_argument("--widths", help="Comma-separated list of widths to create from one decode, e.g. 3840,1920,960,480.")
+    parser.add_argument("--linear", action="store_true", help="Resample in linear light instead of on the encoded sRGB values.")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes. Defaults to the CPU count.")
 
     args = parser.parse_args()
 
+    image_paths = list(args.image_paths)
+    if args.file_list:
+        image_paths.extend(read_file_list(args.file_list))
+    from_explorer = not image_paths
+    if from_explorer:
+        image_paths = get_selected_files_from_explorer()
+
+    valid_image_paths = [p for p in image_paths if os.path.exists(p)]
+    if not valid_image_paths:
+        print("Error: No valid image files found (or none selected in Explorer).")
+        print("Press Enter to exit.")
+        input()
+        return
+
+    # --- Implement Lock File Mechanism ---
+    # Create a unique identifier for this set of selected files
+    # Sort for consistent hash regardless of selection order
+    lock_acquired = False
+    lock_file_path = None
+    if from_explorer:
+        selected_files_hash = hashlib.md5("".join(sorted(valid_image_paths)).encode()).hexdigest()
+        lock_dir = os.path.join(tempfile.gettempdir(), "TS_Toolbox_ImgResize_Locks")
+        os.makedirs(lock_dir, exist_ok=True)
+        lock_file_path = os.path.join(lock_dir, f"{selected_files_hash}.lock")
+        try:
+            fd = os.open(lock_file_path, os.O_CREAT | os.O_EXCL | os.O_RDWR)
+            os.close(fd)
+            lock_acquired = True
+            time.sleep(0.5) # Give a small buffer time
+        except FileExistsError:
+            print("Another instance of Image Resize is already processing this selection. Exiting redundant invocation.")
+            return
+        except Exception as e:
+            print(f"ERROR: Could not create lock file {lock_file_path}: {e}. Proceeding anyway, but may cause redundant operations.")
+
     try:
-        image_path = args.image_path
-        new_width = args.width
+        new_widths = None
+        if args.widths:
+            new_widths = parse_widths(args.widths)
+            if new_widths is None:
+                print(f"Invalid --widths value '{args.widths}'.")
+        elif args.width is not None:
+            new_widths = [args.width]
 
-        if new_width is None:
+        if new_widths is None:
             while True:
-                try:
-                    width_input = input("Enter new width for the image (e.g., 1920): ")
-                    new_width = int(width_input)
-                    if new_width <= 0:
-                        print("Width must be a positive integer.")
-                        continue
-                    break
-                except ValueError:
-                    print("Invalid input. Please enter a number.")
-            
-        if not os.path.exists(image_path):
-            print(f"Error: The file '{image_path}' does not exist.")
-            print("Press Enter to exit.")
-            input()
-            return
-            
-        print(f"Image to resize: {image_path}")
-        print(f"Desired width: {new_width}")
-        success = converter.convert_img_resize(image_path, new_width)
+                widths_input = input("Enter new width for the image (e.g., 1920, or 3840,1920,960 for several): ")
+                new_widths = parse_widths(widths_input)
+                if new_widths is None:
+                    print("Invalid input. Please enter positive whole numbers separated by commas.")
+                    continue
+                break
+
+        import converter
+
+        print(f"Desired width(s): {', '.join(str(w) for w in new_widths)}")
+        if len(valid_image_paths) > 1:
+            print(f"Resizing {len(valid_image_paths)} images...")
+            success = converter.convert_img_resize_batch(valid_image_paths, new_widths, max_workers=args.workers,
+                                                        linear_light=args.linear)
+        elif len(new_widths) == 1:
+            print(f"Image to resize: {valid_image_paths[0]}")
+            success = converter.convert_img_resize(valid_image_paths[0], new_widths[0], linear_light=args.linear)
+        else:
+            print(f"Image to resize: {valid_image_paths[0]}")
+            success = converter.convert_img_resize_multi(valid_image_paths[0], new_widths, linear_light=args.linear)
 
         if success:
             print("\nConversion finished successfully!")
@@ -51,6 +147,11 @@ def main():
         import traceback
         traceback.print_exc()
     finally:
+        if lock_acquired and os.path.exists(lock_file_path):
+            try:
+                os.remove(lock_file_path)
+            except Exception as e:
+                print(f"WARNING: Could not remove lock file {lock_file_path}: {e}")
         print("Press Enter to exit.")
         input()
 
@@ -1,73 +1,130 @@
 import sys
 import os
 import glob
+import argparse
+import hashlib
+import tempfile
+import time # For time.sleep
 
 # This allows the script to find the 'converter' module.
 sys.path.append(os.path.dirname(__file__))
 
-import converter
+# converter (numpy, PIL, OIIO, OCIO) is imported only after the selection lock is acquired,
+# so the redundant per-file invocations Explorer starts for a multi-selection exit quickly.
+
+def get_selected_files_from_explorer():
+    """
+    Retrieves the full paths of files selected in the active Windows Explorer window.
+    Requires pywin32.
+    """
+    selected_files = []
+    try:
+        import win32com.client # Required for pywin32 shell interaction
+        shell_app = win32com.client.Dispatch("Shell.Application")
+        for window in shell_app.Windows():
+            if os.path.basename(window.FullName).lower() == "explorer.exe":
+                try:
+                    selection = window.document.SelectedItems()
+                    if selection.Count > 0:
+                        for item in selection:
+                            selected_files.append(item.Path)
+                        return selected_files
+                except Exception as e:
+                    pass
+    except Exception as e:
+        print(f"ERROR: Could not access Windows Shell Application: {e}")
+        print("Please ensure pywin32 is correctly installed and you are running this from Explorer.")
+    return selected_files
 
 def main():
     """
     Entry point for the Image Upscale (Real-ESRGAN) conversion.
-    Processes selected image files and allows user to choose an ESRGAN model.
+    Accepts image paths or (without any) the current Explorer selection, and allows the
+    user to choose an ESRGAN model. Several images are upscaled in one Real-ESRGAN run.
     """
-    try:
-        if len(sys.argv) < 2:
-            print("Error: No image file paths provided.")
-            print("Press Enter to exit.")
-            input()
-            return
+    parser = argparse.ArgumentParser(description="Upscale images with Real-ESRGAN.")
+    parser.add_argument("image_paths", nargs="*", help="Paths to the input image files.")
+    parser.add_argument("--model", default=None, help="Model name; prompted from the installed models if omitted.")
+    parser.add_argument("--tile", type=int, default=0, help="Tile size in pixels; lower needs less GPU memory. Default 0 is automatic.")
+    parser.add_argument("--jobs", default=None, help="Real-ESRGAN threads as load:proc:save, e.g. 1:2:2.")
+    parser.add_argument("--no-batch", action="store_true", help="Start the upscaler once per image.")
 
-        image_paths = sys.argv[1:]
-        existing_image_paths = [path for path in image_paths if os.path.exists(path)]
+    args = parser.parse_args()
 
-        if not existing_image_paths:
-            print("Error: No valid image files found among the selected items.")
-            print("Press Enter to exit.")
-            input()
-            return
+    image_paths = list(args.image_paths)
+    from_explorer = not image_paths
+    if from_explorer:
+        image_paths = get_selected_files_from_explorer()
 
-        # --- Model Selection Logic ---
-        REALESRGAN_DIR = os.path.join(os.environ.get('LOCALAPPDATA'), 'Programs', 'TS_Toolbox', 'realesrgan')
-        MODEL_DIR = os.path.join(REALESRGAN_DIR, 'models')
+    existing_image_paths = [path for path in image_paths if os.path.exists(path)]
+    if not existing_image_paths:
+        print("Error: No valid image files found among the selected items.")
+        print("Press Enter to exit.")
+        input()
+        return
 
-        if not os.path.exists(MODEL_DIR):
-            print(f"Error: Real-ESRGAN models directory not found at '{MODEL_DIR}'.")
-            print("Please ensure Real-ESRGAN is correctly installed (run install.bat).")
-            print("Press Enter to exit.")
-            input()
+    # --- Implement Lock File Mechanism ---
+    lock_acquired = False
+    lock_file_path = None
+    if from_explorer:
+        selected_files_hash = hashlib.md5("".join(sorted(existing_image_paths)).encode()).hexdigest()
+        lock_dir = os.path.join(tempfile.gettempdir(), "TS_Toolbox_ImgUpscale_Locks")
+        os.makedirs(lock_dir, exist_ok=True)
+        lock_file_path = os.path.join(lock_dir, f"{selected_files_hash}.lock")
+        try:
+            fd = os.open(lock_file_path, os.O_CREAT | os.O_EXCL | os.O_RDWR)
+            os.close(fd)
+            lock_acquired = True
+            time.sleep(0.5) # Give a small buffer time
+        except FileExistsError:
+            print("Another instance of Image Upscale is already processing this selection. Exiting redundant invocation.")
             return
+        except Exception as e:
+            print(f"ERROR: Could not create lock file {lock_file_path}: {e}. Proceeding anyway, but may cause redundant operations.")
 
-        available_models = {}
-        model_files = glob.glob(os.path.join(MODEL_DIR, '*.bin'))
-        
-        if not model_files:
-            print(f"Error: No Real-ESRGAN model files (.bin) found in '{MODEL_DIR}'.")
-            print("Please ensure Real-ESRGAN is correctly installed and its models are present.")
-            print("Press Enter to exit.")
-            input()
-            return
+    try:
+        import converter
+
+        selected_model_name = args.model
+        if selected_model_name is None:
+            # --- Model Selection Logic ---
+            if not converter.REALESRGAN_EXE:
+                print("Error: Real-ESRGAN location unknown (LOCALAPPDATA is not set).")
+                return
+            MODEL_DIR = os.path.join(os.path.dirname(converter.REALESRGAN_EXE), 'models')
+
+            if not os.path.exists(MODEL_DIR):
+                print(f"Error: Real-ESRGAN models directory not found at '{MODEL_DIR}'.")
+                print("Please ensure Real-ESRGAN is correctly installed (run install.bat).")
+                return
+
+            available_models = {}
+            model_files = glob.glob(os.path.join(MODEL_DIR, '*.bin'))
+
+            if not model_files:
+                print(f"Error: No Real-ESRGAN model files (.bin) found in '{MODEL_DIR}'.")
+                print("Please ensure Real-ESRGAN is correctly installed and its models are present.")
+                return
 
-        print("\nAvailable Real-ESRGAN Models:")
-        for i, model_path in enumerate(model_files):
-            model_name = os.path.splitext(os.path.basename(model_path))[0]
-            available_models[str(i + 1)] = model_name
-            print(f"  {i + 1}: {model_name}")
+            print("\nAvailable Real-ESRGAN Models:")
+            for i, model_path in enumerate(model_files):
+                model_name = os.path.splitext(os.path.basename(model_path))[0]
+                available_models[str(i + 1)] = model_name
+                print(f"  {i + 1}: {model_name}")
 
-        selected_model_name = None
-        while selected_model_name is None:
-            choice = input("Enter the number of the model to use (or 1 for default if available): ").strip()
-            if choice in available_models:
-                selected_model_name = available_models[choice]
-            else:
-                print("Invalid choice. Please enter a number from the list.")
+            while selected_model_name is None:
+                choice = input("Enter the number of the model to use (or 1 for default if available): ").strip()
+                if choice in available_models:
+                    selected_model_name = available_models[choice]
+                else:
+                    print("Invalid choice. Please enter a number from the list.")
 
         print(f"\nUsing model: {selected_model_name}")
 
         print(f"Starting Real-ESRGAN Upscale for {len(existing_image_paths)} image(s)...")
         
-        success = converter.upscale_image_realesrgan(existing_image_paths, model_name=selected_model_name)
+        success = converter.upscale_image_realesrgan(existing_image_paths, model_name=selected_model_name,
+                                                     batch=not args.no_batch, tile_size=args.tile, jobs=args.jobs)
 
         if success:
             print("\nImage Upscale finished successfully!")
@@ -78,9 +135,14 @@ def main():
         import traceback
         traceback.print_exc()
     finally:
+        if lock_acquired and os.path.exists(lock_file_path):
+            try:
+                os.remove(lock_file_path)
+            except Exception as e:
+                print(f"WARNING: Could not remove lock file {lock_file_path}: {e}")
         print("Press Enter to exit.")
         input() # Waits for user input
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -16,6 +16,16 @@ def main():
     parser.add_argument("video_path", help="Path to the input MP4 video file.")
     parser.add_argument("--quality", type=int, default=90, 
                         help="JPEG quality (1-100). Default is 90.")
+    parser.add_argument("--start", type=float, default=None, help="Start of the range in seconds.")
+    parser.add_argument("--end", type=float, default=None, help="End of the range in seconds.")
+    parser.add_argument("--start-frame", type=int, default=None, help="First frame of the range (numbered from 1).")
+    parser.add_argument("--end-frame", type=int, default=None, help="Last frame of the range (inclusive).")
+    sample_group = parser.add_mutually_exclusive_group()
+    sample_group.add_argument("--every", type=int, default=None, help="Keep every Nth frame.")
+    sample_group.add_argument("--fps", type=float, default=None, help="Keep frames at this rate, e.g. 1 for one per second.")
+    sample_group.add_argument("--scene", type=float, default=None,
+                              help="Keep only scene changes above this score (0-1, e.g. 0.3).")
+    parser.add_argument("--scale", type=float, default=None, help="Output scale factor, e.g. 0.5.")
 
     args = parser.parse_args()
 
@@ -31,7 +41,11 @@ def main():
             
         print(f"File to convert: {video_path}")
         print(f"Using JPEG quality: {quality}")
-        success = converter.convert_mp4_to_jpg_sequence(video_path, quality=quality)
+        success = converter.convert_mp4_to_jpg_sequence(video_path, quality=quality,
+                                                        start_time=args.start, end_time=args.end,
+                                                        start_frame=args.start_frame, end_frame=args.end_frame,
+                                                        every_nth=args.every, sample_fps=args.fps,
+                                                        scene_threshold=args.scene, scale=args.scale)
 
         if success:
             print("\nConversion finished successfully!")
@@ -1,5 +1,6 @@
 import sys
 import os
+import argparse
 
 # This allows the script to find the 'converter' module
 # when called from an external process.
@@ -11,15 +12,34 @@ def main():
     """
     Entry point for the MP4 to PNG sequence conversion.
     """
-    # The first argument (sys.argv[0]) is the script name.
-    # The second argument (sys.argv[1]) is the file path from the context menu.
-    if len(sys.argv) < 2:
+    parser = argparse.ArgumentParser(description="Convert MP4 video to PNG sequence.")
+    parser.add_argument("video_path", nargs="?", help="Path to the input MP4 video file.")
+    parser.add_argument("--start", type=float, default=None, help="Start of the range in seconds.")
+    parser.add_argument("--end", type=float, default=None, help="End of the range in seconds.")
+    parser.add_argument("--start-frame", type=int, default=None, help="First frame of the range (numbered from 1).")
+    parser.add_argument("--end-frame", type=int, default=None, help="Last frame of the range (inclusive).")
+    sample_group = parser.add_mutually_exclusive_group()
+    sample_group.add_argument("--every", type=int, default=None, help="Keep every Nth frame.")
+    sample_group.add_argument("--fps", type=float, default=None, help="Keep frames at this rate, e.g. 1 for one per second.")
+    sample_group.add_argument("--scene", type=float, default=None,
+                              help="Keep only scene changes above this score (0-1, e.g. 0.3).")
+    parser.add_argument("--scale", type=float, default=None, help="Output scale factor, e.g. 0.5.")
+    parser.add_argument("--segments", type=int, default=1,
+                        help="Extract this many keyframe-aligned segments concurrently (0: CPU count). Default is 1.")
+    parser.add_argument("--compression", type=int, default=None, choices=range(10), metavar="0-9",
+                        help="PNG zlib compression level; lower writes faster but larger files.")
+    parser.add_argument("--prediction", choices=converter.PNG_PREDICTION_MODES, default=None,
+                        help="PNG row filter; 'none' writes fastest, 'paeth'/'mixed' compress best.")
+
+    args = parser.parse_args()
+
+    if not args.video_path:
         print("Error: No file path provided.")
         print("Press Enter to exit.") # Keeps the window open to see the error
         input()
         return
 
-    video_path = sys.argv[1]
+    video_path = args.video_path
 
     if not os.path.exists(video_path):
         print(f"Error: The file '{video_path}' does not exist.")
@@ -28,7 +48,13 @@ def main():
         return
         
     print(f"File to convert: {video_path}")
-    success = converter.convert_mp4_to_png_sequence(video_path)
+    success = converter.convert_mp4_to_png_sequence(video_path, start_time=args.start, end_time=args.end,
+                                                    start_frame=args.start_frame, end_frame=args.end_frame,
+                                                    every_nth=args.every, sample_fps=args.fps,
+                                                    scene_threshold=args.scene, scale=args.scale,
+                                                    segments=args.segments or os.cpu_count() or 1,
+                                                    png_compression=args.compression,
+                                                    png_prediction=args.prediction)
 
     if success:
         print("\nConversion finished successfully!")
@@ -39,4 +65,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -1,5 +1,6 @@
 import sys
 import os
+import argparse
 
 # This allows the script to find the 'converter' module.
 sys.path.append(os.path.dirname(__file__))
@@ -10,13 +11,21 @@ def main():
     """
     Entry point for the image sequence to MP4 conversion.
     """
-    if len(sys.argv) < 2:
+    parser = argparse.ArgumentParser(description="Convert an image sequence to an MP4.")
+    parser.add_argument("file_path", nargs="?", help="Path to one file of the image sequence.")
+    parser.add_argument("--framerate", type=int, default=25, help="Frame rate of the output video. Default is 25.")
+    parser.add_argument("--profile", choices=list(converter.ENCODER_PROFILES), default=converter.DEFAULT_ENCODER_PROFILE,
+                        help="Encoder speed/quality profile. Default is review.")
+
+    args = parser.parse_args()
+
+    if not args.file_path:
         print("Error: No file path provided.")
         print("Press Enter to exit.")
         input()
         return
 
-    file_path = sys.argv[1]
+    file_path = args.file_path
 
     if not os.path.exists(file_path):
         print(f"Error: The file '{file_path}' does not exist.")
@@ -25,9 +34,7 @@ def main():
         return
 
     print(f"File provided for sequence: {file_path}")
-    # We can add more logic here to ask for framerate if we want
-    # For now, we'll use the default.
-    success = converter.convert_sequence_to_mp4(file_path, framerate=25)
+    success = converter.convert_sequence_to_mp4(file_path, framerate=args.framerate, profile=args.profile)
 
     if success:
         print("\nConversion finished successfully!")
@@ -38,4 +45,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,51 @@
+import sys
+import os
+import argparse
+
+# This allows the script to find the 'converter' module
+# when called from an external process.
+sys.path.append(os.path.dirname(__file__))
+
+import converter
+
+def main():
+    """
+    Entry point for creating a filmstrip contact sheet of evenly spaced frames of one video.
+    """
+    parser = argparse.ArgumentParser(description="Create a contact sheet of evenly spaced frames of a video.")
+    parser.add_argument("video_path", help="Path to the input video file.")
+    parser.add_argument("--frames", type=int, default=48, help="Number of frames on the sheet. Default is 48.")
+    parser.add_argument("--columns", type=int, default=8, help="Number of columns of the grid. Default is 8.")
+    parser.add_argument("--cell-height", type=int, default=converter.CONTACT_SHEET_CELL_HEIGHT,
+                        help="Maximum frame height on the sheet in pixels.")
+    parser.add_argument("--keyframes", action="store_true",
+                        help="Decode keyframes only; fastest, but frames snap to the nearest following keyframe.")
+
+    args = parser.parse_args()
+
+    try:
+        if not os.path.exists(args.video_path):
+            print(f"Error: The file '{args.video_path}' does not exist.")
+            print("Press Enter to exit.") # Keeps the window open to see the error
+            input()
+            return
+
+        print(f"File to process: {args.video_path}")
+        success = converter.create_video_filmstrip(args.video_path, num_frames=args.frames, columns=args.columns,
+                                                   cell_height=args.cell_height, keyframes_only=args.keyframes)
+
+        if success:
+            print("\nFilmstrip created successfully!")
+        else:
+            print("\nFailed to create filmstrip. Please check the errors above.")
+    except Exception as e:
+        print(f"\nAn unhandled error occurred: {e}")
+        import traceback
+        traceback.print_exc()
+    finally:
+        print("Press Enter to exit.")
+        input() # Waits for user input
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,6 @@
 import sys
 import os
+import argparse
 import win32com.client # Required for pywin32 shell interaction
 import hashlib
 import tempfile
@@ -32,12 +33,36 @@ def get_selected_files_from_explorer():
         print("Please ensure pywin32 is correctly installed and you are running this from Explorer.")
     return selected_files
 
+def parse_widths(widths_str):
+    """
+    Parses a comma-separated list of widths (e.g. "1920,1280,640").
+    Returns a list of positive integers, or None if the input is invalid.
+    """
+    try:
+        widths = [int(w) for w in widths_str.replace(' ', '').split(',') if w]
+    except ValueError:
+        return None
+    if not widths or any(w <= 0 for w in widths):
+        return None
+    return widths
+
 def main():
     """
     Entry point for resizing videos.
     Retrieves selected files directly from Windows Explorer using pywin32.
-    Prompts user for new width.
+    Prompts user for new width unless --width is given.
     """
+    parser = argparse.ArgumentParser(description="Resize the videos selected in Explorer.")
+    parser.add_argument("--width", type=int, default=None, help="New video width in pixels (prompted if omitted).")
+    parser.add_argument("--widths", help="Comma-separated list of widths to write from one decode, e.g. 1920,1280,640.")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="Maximum number of concurrent FFmpeg jobs (default: CPU count, limited by each job's thread budget).")
+    parser.add_argument("--profile", choices=list(converter.ENCODER_PROFILES), default=converter.DEFAULT_ENCODER_PROFILE,
+                        help="Encoder speed/quality profile. Default is review.")
+    parser.add_argument("--keep-10-bit", action="store_true",
+                        help="Encode 10-bit sources as 10-bit H.264 (High 10) instead of 8-bit yuv420p. Not every player supports it.")
+    args = parser.parse_args()
+
     video_paths = get_selected_files_from_explorer()
 
     # Define accepted video file extensions
@@ -82,22 +107,21 @@ def main():
         pass
 
     try:
-        new_width_str = ""
-        while not (new_width_str.isdigit() and int(new_width_str) > 0):
-            new_width_str = input("Enter new video width (pixels, e.g., 1920): ")
-            if not (new_width_str.isdigit() and int(new_width_str) > 0):
-                print("Invalid input. Please enter a positive integer for the width.")
-        new_width = int(new_width_str)
-
-        print(f"Resizing {len(valid_video_paths)} videos to {new_width}px width...")
-        all_success = True
-        for path in valid_video_paths:
-            print(f"\nProcessing: {os.path.basename(path)}")
-            if not converter.convert_vid_resize(path, new_width):
-                all_success = False
-                print(f"Failed to resize {os.path.basename(path)}.")
-        
-        if all_success:
+        new_widths = None
+        if args.widths:
+            new_widths = parse_widths(args.widths)
+            if new_widths is None:
+                print(f"Invalid --widths value '{args.widths}'.")
+        elif args.width and args.width > 0:
+            new_widths = [args.width]
+
+        while new_widths is None:
+            new_widths = parse_widths(input("Enter new video width (pixels, e.g., 1920, or 1920,1280,640 for several): "))
+            if new_widths is None:
+                print("Invalid input. Please enter positive integers separated by commas.")
+
+        if converter.convert_vid_resize_batch(valid_video_paths, new_widths, max_jobs=args.jobs, profile=args.profile,
+                                            keep_10_bit=args.keep_10_bit):
             print("\nAll selected videos resized successfully!")
         else:
             print("\nSome videos failed to resize. Please check the logs above.")
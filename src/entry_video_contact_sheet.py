@@ -1,5 +1,6 @@
 import sys
 import os
+import argparse
 import win32com.client # Required for pywin32 shell interaction
 import hashlib
 import tempfile
@@ -40,6 +41,20 @@ def main():
     Entry point for creating a video contact sheet.
     Retrieves selected files directly from Windows Explorer using pywin32.
     """
+    parser = argparse.ArgumentParser(description="Create a video contact sheet from the videos selected in Explorer.")
+    parser.add_argument("--columns", type=int, default=2, help="Number of columns of the grid.")
+    parser.add_argument("--duration", type=float, default=5, help="Snippet duration in seconds.")
+    parser.add_argument("--offset", default="start",
+                        help="Where the snippets start: 'start', 'middle' or a percentage such as '25%%'.")
+    stage_group = parser.add_mutually_exclusive_group()
+    stage_group.add_argument("--two-stage", dest="two_stage", action="store_true", default=None,
+                             help="Pre-scale the snippets in parallel (cached) before composing the grid.")
+    stage_group.add_argument("--single-pass", dest="two_stage", action="store_false",
+                             help="Decode, scale and compose all clips in one FFmpeg process.")
+    parser.add_argument("--profile", choices=list(converter.ENCODER_PROFILES), default=converter.DEFAULT_ENCODER_PROFILE,
+                        help="Encoder speed/quality profile. Default is review.")
+    args = parser.parse_args()
+
     video_paths = get_selected_files_from_explorer()
 
     # Define accepted video file extensions
@@ -94,7 +109,9 @@ def main():
         for path in valid_video_paths:
             print(f"  - {os.path.basename(path)}")
 
-        success = converter.create_video_contact_sheet(valid_video_paths)
+        success = converter.create_video_contact_sheet(valid_video_paths, columns=args.columns,
+                                                       snippet_duration=args.duration, snippet_offset=args.offset,
+                                                       two_stage=args.two_stage, profile=args.profile)
 
         if success:
             print("\nVideo contact sheet created successfully!")
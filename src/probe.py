@@ -0,0 +1,186 @@
+import os
+import json
+import hashlib
+import subprocess
+import tempfile
+import threading
+import concurrent.futures
+from collections import namedtuple
+from fractions import Fraction
+
+# Stream information of a video file, as returned by probe_video / probe_videos.
+# width/height are the coded size (before rotation), duration is in seconds, fps is a float,
+# rotation is the display rotation in degrees (0, 90, 180 or 270).
+VideoInfo = namedtuple("VideoInfo", ["width", "height", "duration", "fps", "codec", "pix_fmt", "rotation", "has_audio"])
+
+PROBE_CACHE_DIR = os.path.join(os.environ.get('LOCALAPPDATA') or tempfile.gettempdir(), 'TS_Toolbox', 'probe_cache')
+
+def _get_probe_cache_path(video_path, cache_dir):
+    """
+    Returns the cache file of a video's ffprobe output. The key covers the absolute path,
+    modification time and file size, so a re-rendered file is probed again.
+    """
+    stat = os.stat(video_path)
+    key = f"{os.path.abspath(video_path)}|{stat.st_mtime_ns}|{stat.st_size}"
+    return os.path.join(cache_dir, hashlib.md5(key.encode()).hexdigest() + ".json")
+
+def _parse_frame_rate(rate):
+    """Parses an ffprobe rate such as '30000/1001' into a float, or 0.0 if it is unknown."""
+    try:
+        numerator, _, denominator = (rate or "0/0").partition('/')
+        denominator = float(denominator or 1)
+        return float(numerator) / denominator if denominator else 0.0
+    except ValueError:
+        return 0.0
+
+def _parse_video_info(probe_data):
+    """
+    Builds a VideoInfo from ffprobe's JSON output.
+
+    Args:
+        probe_data (dict): The parsed JSON output of ffprobe (see _run_ffprobe).
+
+    Returns:
+        VideoInfo: The stream information, or None if the file has no video stream.
+    """
+    streams = probe_data.get("streams", [])
+    video_stream = next((s for s in streams if s.get("codec_type") == "video"), None)
+    if video_stream is None:
+        return None
+
+    duration = float(video_stream.get("duration") or probe_data.get("format", {}).get("duration") or 0.0)
+    fps = _parse_frame_rate(video_stream.get("avg_frame_rate")) or _parse_frame_rate(video_stream.get("r_frame_rate"))
+
+    # Older files carry a 'rotate' tag, newer ffprobe versions report a display matrix.
+    rotation = video_stream.get("tags", {}).get("rotate")
+    for side_data in video_stream.get("side_data_list", []):
+        if "rotation" in side_data:
+            rotation = side_data["rotation"]
+    rotation = int(float(rotation or 0)) % 360
+
+    return VideoInfo(
+        width=int(video_stream.get("width") or 0),
+        height=int(video_stream.get("height") or 0),
+        duration=duration,
+        fps=fps,
+        codec=video_stream.get("codec_name", ""),
+        pix_fmt=video_stream.get("pix_fmt", ""),
+        rotation=rotation,
+        has_audio=any(s.get("codec_type") == "audio" for s in streams),
+    )
+
+def _run_ffprobe(video_path, ffprobe_exe):
+    """Runs ffprobe with JSON output on one file and returns the parsed output."""
+    probe_cmd_list = [
+        ffprobe_exe, '-v', 'error',
+        '-show_entries', 'stream=codec_type,codec_name,width,height,pix_fmt,avg_frame_rate,r_frame_rate,duration'
+                         ':stream_tags=rotate:stream_side_data=rotation:format=duration',
+        '-of', 'json', video_path
+    ]
+    probe_output = subprocess.check_output(probe_cmd_list, stderr=subprocess.PIPE, text=True)
+    return json.loads(probe_output)
+
+def probe_video(video_path, ffprobe_exe, cache_dir=PROBE_CACHE_DIR):
+    """
+    Returns the stream information of a video, from the on-disk cache when the file has not
+    changed since it was last probed.
+
+    Args:
+        video_path (str): The full path to the video file.
+        ffprobe_exe (str): The path to the ffprobe executable.
+        cache_dir (str): The probe cache directory, or None to always run ffprobe.
+
+    Returns:
+        VideoInfo: The stream information, or None if the file could not be probed or has
+                   no video stream.
+    """
+    if not os.path.exists(video_path):
+        print(f"WARNING: Video not found: {video_path}")
+        return None
+
+    cache_path = None
+    if cache_dir:
+        cache_path = _get_probe_cache_path(video_path, cache_dir)
+        try:
+            with open(cache_path, 'r') as f:
+                return _parse_video_info(json.load(f))
+        except (OSError, ValueError):
+            pass
+
+    try:
+        probe_data = _run_ffprobe(video_path, ffprobe_exe)
+    except subprocess.CalledProcessError as e:
+        print(f"WARNING: ffprobe failed for {os.path.basename(video_path)}: {e.stderr.strip()}")
+        return None
+    except (OSError, ValueError) as e:
+        print(f"WARNING: Could not probe {os.path.basename(video_path)}: {e}")
+        return None
+
+    if cache_path:
+        # Write to a temporary name first, so a concurrent run never reads a partial file.
+        temp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            with open(temp_path, 'w') as f:
+                json.dump(probe_data, f)
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            print(f"WARNING: Could not cache probe result of {os.path.basename(video_path)}: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    return _parse_video_info(probe_data)
+
+def probe_videos(video_paths, ffprobe_exe, max_workers=None, cache_dir=PROBE_CACHE_DIR):
+    """
+    Probes many videos concurrently. ffprobe runs as separate processes, so a thread pool
+    is enough to keep several of them busy.
+
+    Args:
+        video_paths (list): The full paths to the video files.
+        ffprobe_exe (str): The path to the ffprobe executable.
+        max_workers (int): Number of concurrent ffprobe processes. Defaults to the CPU count.
+        cache_dir (str): The probe cache directory, or None to always run ffprobe.
+
+    Returns:
+        dict: A mapping of video path to VideoInfo (None for files that could not be probed).
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        infos = executor.map(lambda path: probe_video(path, ffprobe_exe, cache_dir), video_paths)
+        return dict(zip(video_paths, infos))
+
+def probe_keyframes(video_path, ffprobe_exe):
+    """
+    Returns the keyframe times of a video's first video stream. Only the packet index is
+    read, nothing is decoded. The times are computed from the integer packet timestamps and
+    the stream time base, since ffprobe's pts_time is rounded to microseconds.
+
+    Args:
+        video_path (str): The full path to the video file.
+        ffprobe_exe (str): The path to the ffprobe executable.
+
+    Returns:
+        list: Sorted keyframe times in seconds, relative to the start of the file as FFmpeg's
+              -ss counts them, or None if the file could not be probed.
+    """
+    probe_cmd_list = [
+        ffprobe_exe, '-v', 'error', '-select_streams', 'v:0',
+        '-show_entries', 'packet=pts,flags:stream=time_base:format=start_time',
+        '-of', 'json', video_path
+    ]
+    try:
+        probe_data = json.loads(subprocess.check_output(probe_cmd_list, stderr=subprocess.PIPE, text=True))
+    except subprocess.CalledProcessError as e:
+        print(f"WARNING: ffprobe failed for {os.path.basename(video_path)}: {e.stderr.strip()}")
+        return None
+    except (OSError, ValueError) as e:
+        print(f"WARNING: Could not probe keyframes of {os.path.basename(video_path)}: {e}")
+        return None
+
+    streams = probe_data.get("streams", [])
+    if not streams:
+        return []
+    time_base = Fraction(streams[0].get("time_base") or "1/1")
+    start_time = Fraction(probe_data.get("format", {}).get("start_time") or "0")
+    return sorted(float(int(packet["pts"]) * time_base - start_time) for packet in probe_data.get("packets", [])
+                  if 'K' in packet.get("flags", "") and packet.get("pts") not in (None, "N/A"))
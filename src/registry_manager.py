@@ -15,17 +15,21 @@ SUBMENU_KEY_FULL_PATH = r"Software\Classes\%s" % SUBMENU_KEY_NAME
 # List of submenu items for regular right-click (including Contact Sheet)
 SUBMENU_ITEMS = [
     ("EXR > MP4 (ACEScg-sRGB)", "entry_exr_to_mp4.py"),
+    ("EXR > MP4 Follow (ACEScg-sRGB)", "entry_exr_to_mp4.py"),
     ("EXR > JPG (ACEScg-sRGB)", "entry_exr_to_jpg.py"),
+    ("EXR > MP4+JPG+Proxy (ACEScg-sRGB)", "entry_exr_to_renditions.py"),
     ("EXR > Split AOVs", "entry_exr_split_aovs.py"),
     ("IMG > MP4", "entry_seq_to_mp4.py"),
     ("IMG > Resize", "entry_img_resize.py"),
     ("IMG > Half Size", "entry_img_half_size.py"),
     ("IMG > Contact Sheet", "entry_img_contactsheet.py"),
+    ("IMG > Sequence Contact Sheet", "entry_img_contactsheet.py"),
     ("IMG > Upscale", "entry_img_upscale.py"),
     ("VID > PNG", "entry_mp4_to_png.py"),
     ("VID > JPG", "entry_mp4_to_jpg.py"),
     ("VID > Resize", "entry_vid_resize.py"),
     ("VID > Contact Sheet", "entry_video_contact_sheet.py"),
+    ("VID > Filmstrip", "entry_vid_filmstrip.py"),
 ]
 
 def get_install_root_path():
@@ -81,12 +85,18 @@ def add_context_menu_entries():
                 # Wrap all commands in cmd.exe /K to keep the window open
                 if display_text == "VID > JPG":
                     command_args = f'"{python_exe}" "{os.path.join(scripts_path, script_name)}" "%V" --quality 90'
+                elif display_text == "EXR > MP4 Follow (ACEScg-sRGB)": # Keeps encoding while the sequence renders
+                    command_args = f'"{python_exe}" "{os.path.join(scripts_path, script_name)}" "%V" --follow'
                 elif display_text == "IMG > Contact Sheet": # For contact sheet, pywin32 fetches files
                     command_args = f'"{python_exe}" "{os.path.join(scripts_path, script_name)}"' # No args needed, script gets selection
+                elif display_text == "IMG > Sequence Contact Sheet": # 24 evenly spaced frames of the selected frame's sequence
+                    command_args = f'"{python_exe}" "{os.path.join(scripts_path, script_name)}" --frames 24'
                 elif display_text == "VID > Contact Sheet": # For video contact sheet, pywin32 fetches files
                     command_args = f'"{python_exe}" "{os.path.join(scripts_path, script_name)}"' # No args needed, script gets selection
                 elif display_text == "VID > Resize": # For video resize, pywin32 fetches files
                     command_args = f'"{python_exe}" "{os.path.join(scripts_path, script_name)}"' # No args needed, script gets selection
+                elif display_text in ("IMG > Resize", "IMG > Half Size", "IMG > Upscale"): # Batch-capable, pywin32 fetches files
+                    command_args = f'"{python_exe}" "{os.path.join(scripts_path, script_name)}"' # No args needed, script gets selection
                 elif display_text == "EXR > Split AOVs": # For EXR Split AOVs, pywin32 fetches files
                     command_args = f'"{python_exe}" "{os.path.join(scripts_path, script_name)}"' # No args needed, script gets selection
                 else:
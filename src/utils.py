@@ -1,27 +1,24 @@
 import os
 import re
 
-def find_sequence_files(file_path):
+def _get_sequence_regex(file_path):
     """
-    Finds all files in a directory that belong to an image sequence.
+    Builds the regex and FFmpeg pattern describing the image sequence a file belongs to.
 
     Args:
         file_path (str): The path to one file in the sequence.
 
     Returns:
-        tuple: A tuple containing (list_of_files, first_frame, sequence_pattern)
-               or (None, None, None) if no sequence is found.
+        tuple: A tuple containing (compiled_regex, ffmpeg_pattern)
+               or (None, None) if the filename has no frame number.
     """
-    if not os.path.exists(file_path):
-        return None, None, None
-
     directory = os.path.dirname(file_path)
     filename = os.path.basename(file_path)
 
     # Regex to find frame numbers (e.g., frame.1001.exr, frame_v01_1001.exr, frame-1001.exr)
     match = re.search(r'(\d+)\.(?!.*\d)', filename)
     if not match:
-        return None, None, None
+        return None, None
 
     frame_number_str = match.group(1)
     frame_padding = len(frame_number_str)
@@ -36,27 +33,59 @@ def find_sequence_files(file_path):
     
     # Create a regex pattern to find matching files
     regex_pattern = re.compile(
-        re.escape(sequence_prefix) + r'(\d{' + str(frame_padding) + r'})' + re.escape(sequence_suffix)
+        re.escape(sequence_prefix) + r'(\d{' + str(frame_padding) + r'})' + re.escape(sequence_suffix) + '$'
     )
 
-    sequence_files = []
+    # Create an ffmpeg-compatible sequence pattern (e.g., frame.%04d.exr)
+    ffmpeg_pattern = os.path.join(directory, f"{sequence_prefix}%0{frame_padding}d{sequence_suffix}")
+
+    return regex_pattern, ffmpeg_pattern
+
+def list_sequence_frames(file_path):
+    """
+    Lists the frames of an image sequence that currently exist on disk.
+    Unlike find_sequence_files, the given file itself does not need to exist yet,
+    which allows polling a sequence that is still being written.
+
+    Args:
+        file_path (str): The path to one file in the sequence.
+
+    Returns:
+        dict: A mapping of frame number to full file path. Empty if nothing matches.
+    """
+    regex_pattern, _ = _get_sequence_regex(file_path)
+    directory = os.path.dirname(file_path)
+    if not regex_pattern or not os.path.isdir(directory):
+        return {}
+
+    frames = {}
     for f in os.listdir(directory):
-        if regex_pattern.match(f):
-            full_path = os.path.join(directory, f)
-            sequence_files.append(full_path)
+        match = regex_pattern.match(f)
+        if match:
+            frames[int(match.group(1))] = os.path.join(directory, f)
+    return frames
+
+def find_sequence_files(file_path):
+    """
+    Finds all files in a directory that belong to an image sequence.
 
-    if not sequence_files:
+    Args:
+        file_path (str): The path to one file in the sequence.
+
+    Returns:
+        tuple: A tuple containing (list_of_files, first_frame, sequence_pattern)
+               or (None, None, None) if no sequence is found.
+    """
+    if not os.path.exists(file_path):
         return None, None, None
-        
-    sequence_files.sort()
-    
-    # Determine the first frame number from the sorted list
-    first_file_basename = os.path.basename(sequence_files[0])
-    first_frame_match = regex_pattern.match(first_file_basename)
-    first_frame = int(first_frame_match.group(1))
 
-    # Create an ffmpeg-compatible sequence pattern (e.g., frame.%04d.exr)
-    ffmpeg_pattern = os.path.join(directory, f"{sequence_prefix}%0{frame_padding}d{sequence_suffix}")
+    _, ffmpeg_pattern = _get_sequence_regex(file_path)
+    frames = list_sequence_frames(file_path)
+    if not frames:
+        return None, None, None
+
+    first_frame = min(frames)
+    sequence_files = [frames[frame] for frame in sorted(frames)]
 
     return sequence_files, first_frame, ffmpeg_pattern
 
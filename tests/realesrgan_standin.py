@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Stand-in for realesrgan-ncnn-vulkan with the same command line, for running the upscale
+tests on machines without the Vulkan build (select it with TS_TOOLBOX_REALESRGAN_EXE or
+the realesrgan_exe argument). Instead of upscaling, it copies each input to its output,
+so tests can check which input ended up where.
+
+Environment:
+    REALESRGAN_STANDIN_LOG: File to which each invocation's arguments are appended as a JSON line.
+    REALESRGAN_STANDIN_FAIL_AFTER: Exit with an error after this many images.
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-i", dest="input", required=True)
+    parser.add_argument("-o", dest="output", required=True)
+    parser.add_argument("-n", dest="model_name", default="realesrgan-x4plus")
+    parser.add_argument("-s", dest="scale", type=int, default=4)
+    parser.add_argument("-f", dest="format", default="png")
+    parser.add_argument("-t", dest="tile_size", type=int, default=0)
+    parser.add_argument("-j", dest="jobs", default="1:2:2")
+    args = parser.parse_args()
+
+    log_path = os.environ.get("REALESRGAN_STANDIN_LOG")
+    if log_path:
+        with open(log_path, "a") as log_file:
+            log_file.write(json.dumps(sys.argv[1:]) + "\n")
+
+    if os.path.isdir(args.input):
+        # Folder mode: '<output>/<input stem>.<format>' for every input file.
+        jobs = [(os.path.join(args.input, name), os.path.join(args.output, f"{os.path.splitext(name)[0]}.{args.format}"))
+                for name in sorted(os.listdir(args.input))]
+    else:
+        jobs = [(args.input, args.output)]
+
+    fail_after = os.environ.get("REALESRGAN_STANDIN_FAIL_AFTER")
+    for count, (input_path, output_path) in enumerate(jobs):
+        if fail_after is not None and count >= int(fail_after):
+            print(f"vkAllocateMemory failed on {os.path.basename(input_path)}", file=sys.stderr)
+            return 255
+        shutil.copyfile(input_path, output_path)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
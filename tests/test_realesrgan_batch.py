@@ -0,0 +1,119 @@
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+import converter
+
+STANDIN_EXE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "realesrgan_standin.py")
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="the stand-in is started through its shebang line")
+
+MODEL_NAME = "realesrgan-x4plus"
+
+
+def _write_image(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as image_file:
+        image_file.write(content)
+    return str(path)
+
+
+def _read(path):
+    with open(path, "rb") as image_file:
+        return image_file.read()
+
+
+def _output_path(image_path):
+    base_name = os.path.splitext(os.path.basename(image_path))[0]
+    return os.path.join(os.path.dirname(image_path), f"{base_name}_upscaled_esrgan",
+                        f"{base_name}_upscaled_{MODEL_NAME}_x4.png")
+
+
+@pytest.fixture
+def standin_log(tmp_path, monkeypatch):
+    log_path = tmp_path / "standin_calls.jsonl"
+    monkeypatch.setenv("REALESRGAN_STANDIN_LOG", str(log_path))
+
+    def read_calls():
+        if not log_path.exists():
+            return []
+        return [json.loads(line) for line in log_path.read_text().splitlines()]
+    return read_calls
+
+
+@pytest.fixture
+def image_paths(tmp_path):
+    # Two inputs share a file name in different folders; the third has another extension.
+    return [
+        _write_image(tmp_path / "shot_a" / "plate.png", b"plate from shot a"),
+        _write_image(tmp_path / "shot_b" / "plate.png", b"plate from shot b"),
+        _write_image(tmp_path / "shot_b" / "still.jpg", b"still from shot b"),
+    ]
+
+
+def test_realesrgan_path_override(monkeypatch):
+    monkeypatch.setenv("TS_TOOLBOX_REALESRGAN_EXE", STANDIN_EXE)
+    assert converter._get_realesrgan_path() == STANDIN_EXE
+
+
+def test_batch_maps_outputs_back_to_each_image(image_paths, standin_log):
+    assert converter.upscale_image_realesrgan(image_paths, MODEL_NAME, tile_size=256, jobs="1:2:2",
+                                              realesrgan_exe=STANDIN_EXE)
+
+    calls = standin_log()
+    assert len(calls) == 1, "a batch loads the model once"
+    assert calls[0][calls[0].index("-t") + 1] == "256"
+    assert calls[0][calls[0].index("-j") + 1] == "1:2:2"
+    for image_path in image_paths:
+        assert _read(_output_path(image_path)) == _read(image_path)
+
+
+def test_batch_leaves_no_staging_files(image_paths, standin_log):
+    assert converter.upscale_image_realesrgan(image_paths, MODEL_NAME, realesrgan_exe=STANDIN_EXE)
+
+    call = standin_log()[0]
+    staged_input = call[call.index("-i") + 1]
+    assert not os.path.exists(os.path.dirname(staged_input))
+    assert os.path.exists(image_paths[0]), "staging must not move the inputs"
+
+
+def test_failing_run_keeps_finished_images(image_paths, standin_log, monkeypatch, capsys):
+    monkeypatch.setenv("REALESRGAN_STANDIN_FAIL_AFTER", "1")
+
+    assert not converter.upscale_image_realesrgan(image_paths, MODEL_NAME, realesrgan_exe=STANDIN_EXE)
+
+    assert _read(_output_path(image_paths[0])) == _read(image_paths[0])
+    assert not os.path.exists(_output_path(image_paths[1]))
+    assert not os.path.exists(_output_path(image_paths[2]))
+    output = capsys.readouterr().out
+    assert "Return Code: 255" in output
+    assert "produced no output for 'plate.png'" in output
+    assert "produced no output for 'still.jpg'" in output
+
+
+def test_missing_input_is_skipped(image_paths, standin_log, tmp_path):
+    missing_path = str(tmp_path / "shot_c" / "missing.png")
+
+    assert not converter.upscale_image_realesrgan(image_paths + [missing_path], MODEL_NAME,
+                                                  realesrgan_exe=STANDIN_EXE)
+
+    assert len(standin_log()) == 1
+    for image_path in image_paths:
+        assert _read(_output_path(image_path)) == _read(image_path)
+
+
+def test_no_batch_runs_once_per_image(image_paths, standin_log):
+    assert converter.upscale_image_realesrgan(image_paths, MODEL_NAME, batch=False, realesrgan_exe=STANDIN_EXE)
+
+    assert len(standin_log()) == len(image_paths)
+    for image_path in image_paths:
+        assert _read(_output_path(image_path)) == _read(image_path)
+
+
+@pytest.mark.parametrize("jobs", ["2", "1:2", "a:b:c"])
+def test_invalid_jobs_are_rejected(image_paths, standin_log, jobs):
+    assert not converter.upscale_image_realesrgan(image_paths, MODEL_NAME, jobs=jobs, realesrgan_exe=STANDIN_EXE)
+    assert standin_log() == []